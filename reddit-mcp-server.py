@@ -5,73 +5,410 @@ Single file implementation with all possible Reddit operations
 """
 
 import os
-import json
+import functools
 import logging
-from typing import Optional, Dict, Any, List
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Literal
 from fastmcp import FastMCP
+from mcp.types import TextContent
+import orjson
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
 import praw
+import requests
+from requests.adapters import HTTPAdapter
+from praw.exceptions import RedditAPIException
 from praw.models import Submission, Comment, Redditor, Subreddit
 
-# Configure logging to stderr to avoid interfering with stdio
+# Configure logging to stderr (basicConfig's default stream) to avoid
+# interfering with stdio. Log calls pass %-style args so filtered-out
+# messages are never formatted.
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler()]
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
 # Create MCP server instance
 mcp = FastMCP("reddit-mcp-server")
 
-# Global Reddit instance
-reddit = None
-
-def init_reddit():
-    """Initialize Reddit instance with environment variables"""
-    global reddit
-    if reddit is None:
-        reddit = praw.Reddit(
-            client_id=os.environ['REDDIT_CLIENT_ID'],
-            client_secret=os.environ['REDDIT_CLIENT_SECRET'],
-            username=os.environ['REDDIT_USERNAME'],
-            password=os.environ['REDDIT_PASSWORD'],
-            user_agent=f"MCP:reddit-server:v1.0 (by /u/{os.environ['REDDIT_USERNAME']})"
-        )
-        logger.info("Reddit initialized in authenticated mode")
-    return reddit
-
-def serialize_reddit_object(obj):
-    """Convert Reddit objects to JSON-serializable format"""
-    if obj is None:
-        return None
-    
-    # Handle lists
-    if isinstance(obj, list):
-        return [serialize_reddit_object(item) for item in obj]
-    
-    # Handle PRAW models
-    if hasattr(obj, '__dict__'):
-        result = {}
-        for key, value in vars(obj).items():
-            if not key.startswith('_'):
-                try:
-                    # Try to serialize the value
-                    if hasattr(value, '__dict__'):
-                        result[key] = str(value)  # Convert complex objects to string
-                    else:
-                        result[key] = value
-                except:
-                    result[key] = str(value)
-        return result
-    
-    return obj
+# Prefix for the relative permalinks and URLs in API responses
+_REDDIT_BASE = "https://reddit.com"
+
+# Keep-alive connections per host; comfortably above the worker pool plus
+# concurrent tool calls so threaded requests never queue for a connection
+_HTTP_POOL_SIZE = 32
+
+def _create_session() -> requests.Session:
+    """Create the HTTP session PRAW sends every request through"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=_HTTP_POOL_SIZE))
+    return session
+
+def _create_reddit():
+    """Create the authenticated Reddit instance from environment variables"""
+    instance = praw.Reddit(
+        client_id=os.environ['REDDIT_CLIENT_ID'],
+        client_secret=os.environ['REDDIT_CLIENT_SECRET'],
+        username=os.environ['REDDIT_USERNAME'],
+        password=os.environ['REDDIT_PASSWORD'],
+        user_agent=f"MCP:reddit-server:v1.0 (by /u/{os.environ['REDDIT_USERNAME']})",
+        # Skip PRAW's PyPI version lookup; praw is pinned in requirements.txt
+        check_for_updates=False,
+        requestor_kwargs={"session": _create_session()}
+    )
+    logger.info("Reddit initialized in authenticated mode as u/%s", instance.config.username)
+    return instance
+
+# Shared Reddit instance, created once at startup
+_REDDIT = _create_reddit()
+
+# Script auth always acts as the configured account, so its name is known
+# up front and never needs an /api/v1/me round-trip
+_USERNAME = _REDDIT.config.username
+
+# Worker pool for overlapping independent API requests
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Short-lived caches for read-only lookups that agents tend to repeat
+_CACHE_LOCK = threading.Lock()
+_SUBREDDIT_INFO_CACHE = TTLCache(maxsize=512, ttl=60)
+_SUBREDDIT_RULES_CACHE = TTLCache(maxsize=512, ttl=300)
+_SUBREDDIT_MODERATORS_CACHE = TTLCache(maxsize=512, ttl=300)
+_USER_INFO_CACHE = TTLCache(maxsize=512, ttl=60)
+_USER_KARMA_CACHE = TTLCache(maxsize=512, ttl=60)
+_SUBMISSION_CACHE = TTLCache(maxsize=1024, ttl=60)
+_COMMENT_CACHE = TTLCache(maxsize=1024, ttl=60)
+_REDDITOR_CACHE = TTLCache(maxsize=1024, ttl=60)
+_SEARCH_CACHE = TTLCache(maxsize=256, ttl=60)
+_TRENDING_CACHE = TTLCache(maxsize=1, ttl=300)
+_SUBSCRIPTIONS_CACHE = TTLCache(maxsize=16, ttl=60)
+
+# Raw listing fields copied as-is into tool results
+_POST_KEYS = (
+    "id", "title", "author", "created_utc", "score", "upvote_ratio",
+    "num_comments", "url", "selftext", "is_video", "is_self", "stickied",
+    "locked", "spoiler", "distinguished", "link_flair_text",
+    "author_flair_text", "gilded", "total_awards_received"
+)
+# get_subreddit_posts fields computed from the raw post rather than copied
+_POST_DERIVED = {
+    "permalink": lambda post: _REDDIT_BASE + post["permalink"],
+    "nsfw": lambda post: post.get("over_18")
+}
+_USER_POST_KEYS = ("id", "title", "subreddit", "created_utc", "score", "num_comments", "url")
+_COMMENT_KEYS = (
+    "id", "author", "body", "score", "created_utc", "edited",
+    "is_submitter", "stickied", "distinguished", "gilded"
+)
+_SAVED_POST_KEYS = ("id", "title", "subreddit", "score", "created_utc")
+_SAVED_COMMENT_KEYS = ("id", "subreddit", "score", "created_utc")
+_FEED_POST_KEYS = (
+    "id", "title", "author", "subreddit", "created_utc", "score",
+    "num_comments", "url"
+)
+
+# Listing sorts: subreddit sort -> whether it takes a time filter, and
+# user listing sort -> the query parameters Reddit expects for it
+_SUBREDDIT_SORTS = {"hot": False, "new": False, "top": True, "rising": False, "controversial": True}
+_USER_SORTS = {"new": {"sort": "new"}, "top": {"sort": "top", "t": "all"}, "hot": {"sort": "hot"}}
+
+# Inbox filter -> (listing path, query parameters); unread is fetched without
+# marking the messages read, as PRAW's inbox.unread() does
+_INBOX_FILTERS = {
+    "all": ("/message/inbox", None),
+    "unread": ("/message/unread", {"mark": "false"}),
+    "messages": ("/message/messages", None),
+    "comments": ("/message/comments", None),
+    "mentions": ("/message/mentions", None)
+}
+
+@functools.lru_cache(maxsize=512)
+def _subreddit(name: str) -> Subreddit:
+    """Return a cached lazy Subreddit proxy for name"""
+    return _REDDIT.subreddit(name)
+
+@cached(_SUBMISSION_CACHE, lock=_CACHE_LOCK)
+def _get_submission(post_id: str) -> Submission:
+    """Return a lazy Submission proxy for post_id, reused for a minute"""
+    return _REDDIT.submission(id=post_id)
+
+@cached(_COMMENT_CACHE, lock=_CACHE_LOCK)
+def _get_comment(comment_id: str) -> Comment:
+    """Return a lazy Comment proxy for comment_id, reused for a minute"""
+    return _REDDIT.comment(id=comment_id)
+
+@cached(_REDDITOR_CACHE, lock=_CACHE_LOCK)
+def _get_redditor(username: str) -> Redditor:
+    """Return a lazy Redditor proxy for username, reused for a minute"""
+    return _REDDIT.redditor(username)
+
+# Identical GETs in flight at the same time share one request:
+# (path, params) -> [future for the encoded response, number of waiters]
+_INFLIGHT: Dict[tuple, list] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+def _get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """GET an API path on the shared session and return the parsed JSON as-is
+
+    A call that arrives while an identical GET is already in flight gets that
+    earlier request's response, so a read made right after a write (e.g.
+    get_inbox after mark_message_read) may still show the pre-write state.
+    """
+    key = (path, tuple(sorted((params or {}).items())))
+    with _INFLIGHT_LOCK:
+        entry = _INFLIGHT.get(key)
+        if entry is None:
+            entry = _INFLIGHT[key] = [Future(), 0]
+            owner = True
+        else:
+            entry[1] += 1
+            owner = False
+    
+    if not owner:
+        # Callers may mutate what they get back, so each waiter decodes its own copy
+        return orjson.loads(entry[0].result())
+    
+    # The owner always removes the entry and resolves the future, so waiters
+    # and later identical calls can never block on an abandoned request
+    future = entry[0]
+    response = None
+    try:
+        response = _REDDIT.request(method="GET", path=path, params=params)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+            waiters = entry[1]
+        if not future.done():
+            try:
+                future.set_result(orjson.dumps(response) if waiters else None)
+            except BaseException as e:
+                # Encoding failed (e.g. an integer orjson can't represent); the
+                # owner still returns its response, the waiters get the error
+                future.set_exception(e)
+    return response
+
+def _post(path: str, data: Dict[str, Any]) -> Any:
+    """POST form data to an API path and return the parsed JSON, raising on API errors"""
+    response = _REDDIT.request(method="POST", path=path, data=data)
+    # Reddit reports most form errors in a 200 response rather than as a 400;
+    # a 204 (e.g. /api/hide) comes back from prawcore as None
+    errors = (response or {}).get("json", {}).get("errors")
+    if errors:
+        raise RedditAPIException(errors)
+    return response
+
+def _listing(
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = 25
+) -> List[Dict[str, Any]]:
+    """Return up to limit raw children of a listing, following the after cursor"""
+    params = dict(params or {})
+    children = []
+    while limit is None or len(children) < limit:
+        params["limit"] = 100 if limit is None else min(limit - len(children), 100)
+        data = _get(path, params)["data"]
+        children.extend(data["children"])
+        if not data["children"] or not data["after"]:
+            break
+        params["after"] = data["after"]
+    return children
+
+def _fetch_many(ids: List[str], prefix: str) -> List[Dict[str, Any]]:
+    """Fetch raw things by id via /api/info, 100 fullnames per request"""
+    chunks = [ids[start:start + 100] for start in range(0, len(ids), 100)]
+    pages = _EXECUTOR.map(
+        lambda chunk: _get("/api/info", {"id": ",".join(prefix + thing_id for thing_id in chunk)}),
+        chunks
+    )
+    return [child["data"] for page in pages for child in page["data"]["children"]]
+
+def _text(payload: Any) -> TextContent:
+    """Encode a tool result once with orjson as MCP text content"""
+    # default=str matches FastMCP's own fallback for values orjson can't encode
+    return TextContent(type="text", text=orjson.dumps(payload, default=str).decode())
+
+def _row_post(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a raw post from a mixed user listing"""
+    return {
+        "type": "post",
+        **{key: data.get(key) for key in _SAVED_POST_KEYS},
+        "permalink": _REDDIT_BASE + data["permalink"]
+    }
+
+def _row_comment(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a raw comment from a mixed user listing"""
+    return {
+        "type": "comment",
+        **{key: data.get(key) for key in _SAVED_COMMENT_KEYS},
+        "body": data["body"][:200],
+        "permalink": _REDDIT_BASE + data["permalink"]
+    }
+
+# Row builders for the thing kinds that appear in saved/upvoted/downvoted
+_MIXED_HANDLERS = {"t3": _row_post, "t1": _row_comment}
+
+def _mixed_listing(path: str, limit: int) -> List[Dict[str, Any]]:
+    """Shape a listing of mixed posts and comments, skipping any other kinds"""
+    return [
+        _MIXED_HANDLERS[item["kind"]](item["data"])
+        for item in _listing(path, limit=limit)
+        if item["kind"] in _MIXED_HANDLERS
+    ]
+
+def _feed_post(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a raw post from a search or feed listing"""
+    return {
+        **{key: data.get(key) for key in _FEED_POST_KEYS},
+        "selftext": data["selftext"][:200] if data.get("selftext") else None,
+        "permalink": _REDDIT_BASE + data["permalink"]
+    }
+
+def _replies(comment: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the raw reply children of a raw comment"""
+    replies = comment["data"].get("replies")
+    return replies["data"]["children"] if replies else []
+
+def _more_stubs(
+    container: List[Dict[str, Any]],
+    nodes: Optional[List[Dict[str, Any]]] = None
+) -> List[tuple]:
+    """Find "more" stubs under nodes, paired with the list that holds each one"""
+    stubs = []
+    stack = [(container, container if nodes is None else nodes)]
+    while stack:
+        parent_list, children = stack.pop()
+        for child in children:
+            if child["kind"] == "more":
+                stubs.append((parent_list, child))
+            else:
+                replies = _replies(child)
+                if replies:
+                    stack.append((replies, replies))
+    return stubs
+
+def _comment_tree(forest: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert a raw comment forest to nested comment results in a single pass"""
+    comments = []
+    stack = [(forest, comments)]
+    while stack:
+        children, out = stack.pop()
+        for child in children:
+            if child["kind"] != "t1":
+                continue
+            data = child["data"]
+            record = {**{key: data.get(key) for key in _COMMENT_KEYS}, "replies": []}
+            out.append(record)
+            replies = _replies(child)
+            if replies:
+                stack.append((replies, record["replies"]))
+    return comments
+
+# Comment fetch parameters PRAW always sends: its comment_limit and default sort
+_COMMENT_PARAMS = {"limit": 2048, "sort": "confidence"}
+
+# Reddit allows only one /api/morechildren request at a time per client
+_MORECHILDREN_LOCK = threading.Lock()
+
+def _fetch_more(link_id: str, stub: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Fetch the comments hidden behind a "more" stub as a raw forest"""
+    data = stub["data"]
+    if not data["children"]:
+        # "Continue this thread" stub: load the thread below its parent comment
+        parent_id = data["parent_id"].split("_", 1)[1]
+        thread = _get(f"/comments/{link_id}/_/{parent_id}", _COMMENT_PARAMS)[1]["data"]["children"]
+        return _replies(thread[0]) if thread else []
+    
+    things = []
+    with _MORECHILDREN_LOCK:
+        for start in range(0, len(data["children"]), 100):
+            response = _get("/api/morechildren", {
+                "api_type": "json",
+                "link_id": f"t3_{link_id}",
+                "children": ",".join(data["children"][start:start + 100]),
+                "sort": _COMMENT_PARAMS["sort"]
+            })
+            things.extend(response["json"]["data"]["things"])
+    
+    # morechildren returns a flat list, so rebuild the nesting from parent_id
+    comments = {}
+    roots = []
+    for thing in things:
+        parent = comments.get(thing["data"]["parent_id"])
+        if parent is None:
+            roots.append(thing)
+        else:
+            if not parent["data"].get("replies"):
+                parent["data"]["replies"] = {"kind": "Listing", "data": {"children": []}}
+            parent["data"]["replies"]["data"]["children"].append(thing)
+        if thing["kind"] == "t1":
+            comments[thing["data"]["name"]] = thing
+    return roots
+
+def _expand_more(link_id: str, forest: List[Dict[str, Any]], limit: Optional[int]) -> None:
+    """
+    Replace up to limit "more" stubs in forest (None for all), largest first
+    
+    Like PRAW's replace_more, limit counts stubs, not requests: a stub
+    hiding more than 100 comments takes several /api/morechildren calls
+    but counts once. Continue-thread stubs are fetched concurrently;
+    morechildren calls run one at a time, as Reddit requires.
+    """
+    remaining = limit
+    stubs = _more_stubs(forest)
+    while stubs and (remaining is None or remaining > 0):
+        if remaining is not None:
+            # Match replace_more, which expands the stubs hiding the most comments first
+            stubs.sort(key=lambda pair: pair[1]["data"].get("count", 0), reverse=True)
+            stubs = stubs[:remaining]
+            remaining -= len(stubs)
+        
+        forests = _EXECUTOR.map(lambda pair: _fetch_more(link_id, pair[1]), stubs)
+        found = []
+        for (container, stub), roots in zip(stubs, forests):
+            index = next(i for i, child in enumerate(container) if child is stub)
+            container[index:index + 1] = roots
+            found.extend(_more_stubs(container, roots))
+        stubs = found
 
 # ============================================================================
 # SUBREDDIT OPERATIONS
 # ============================================================================
 
+@cached(_SUBREDDIT_INFO_CACHE, lock=_CACHE_LOCK)
+def _fetch_subreddit_info(subreddit_name: str) -> Dict[str, Any]:
+    """Fetch and shape subreddit info, cached for a minute"""
+    subreddit = _get(f"/r/{subreddit_name}/about")["data"]
+    return {
+        "name": subreddit.get("display_name"),
+        "title": subreddit.get("title"),
+        "description": subreddit.get("public_description"),
+        "subscribers": subreddit.get("subscribers"),
+        "created_utc": subreddit.get("created_utc"),
+        "over_18": subreddit.get("over18"),
+        "subreddit_type": subreddit.get("subreddit_type"),
+        "url": _REDDIT_BASE + subreddit["url"],
+        "active_user_count": subreddit.get("active_user_count"),
+        "accounts_active": subreddit.get("accounts_active"),
+        "icon_img": subreddit.get("icon_img"),
+        "banner_img": subreddit.get("banner_img"),
+        "header_img": subreddit.get("header_img"),
+        "allow_images": subreddit.get("allow_images"),
+        "allow_videos": subreddit.get("allow_videos"),
+        "spoilers_enabled": subreddit.get("spoilers_enabled"),
+        "submission_type": subreddit.get("submission_type"),
+        "user_is_banned": subreddit.get("user_is_banned"),
+        "user_is_moderator": subreddit.get("user_is_moderator"),
+        "user_is_subscriber": subreddit.get("user_is_subscriber")
+    }
+
 @mcp.tool()
-def get_subreddit_info(subreddit_name: str) -> Dict[str, Any]:
+def get_subreddit_info(subreddit_name: str) -> TextContent:
     """
     Get detailed information about a subreddit
     
@@ -81,41 +418,21 @@ def get_subreddit_info(subreddit_name: str) -> Dict[str, Any]:
     Returns:
         Subreddit information including description, subscribers, rules, etc.
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
-        return {
-            "name": subreddit.display_name,
-            "title": subreddit.title,
-            "description": subreddit.public_description,
-            "subscribers": subreddit.subscribers,
-            "created_utc": subreddit.created_utc,
-            "over_18": subreddit.over18,
-            "subreddit_type": subreddit.subreddit_type,
-            "url": f"https://reddit.com{subreddit.url}",
-            "active_user_count": subreddit.active_user_count,
-            "accounts_active": subreddit.accounts_active,
-            "icon_img": subreddit.icon_img,
-            "banner_img": subreddit.banner_img,
-            "header_img": subreddit.header_img,
-            "allow_images": subreddit.allow_images,
-            "allow_videos": subreddit.allow_videos,
-            "spoilers_enabled": subreddit.spoilers_enabled,
-            "submission_type": subreddit.submission_type,
-            "user_is_banned": subreddit.user_is_banned,
-            "user_is_moderator": subreddit.user_is_moderator,
-            "user_is_subscriber": subreddit.user_is_subscriber
-        }
+        # Subreddit names are case-insensitive; key the cache on one spelling
+        return _text(_fetch_subreddit_info(subreddit_name.lower()))
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
 def get_subreddit_posts(
     subreddit_name: str,
     sort: str = "hot",
     time_filter: str = "all",
-    limit: int = 25
-) -> List[Dict[str, Any]]:
+    limit: int = 25,
+    columnar: bool = False,
+    fields: Optional[List[str]] = None
+) -> TextContent:
     """
     Get posts from a subreddit
     
@@ -124,59 +441,46 @@ def get_subreddit_posts(
         sort: Sort method (hot, new, top, rising, controversial)
         time_filter: Time filter for top/controversial (hour, day, week, month, year, all)
         limit: Number of posts to retrieve (max 100)
+        columnar: Return one list per field instead of one object per post
+        fields: Only include these fields in each post (default: all fields)
     
     Returns:
-        List of posts from the subreddit
+        List of posts from the subreddit, or a field -> values mapping if columnar
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        try:
+            timed = _SUBREDDIT_SORTS[sort]
+        except KeyError:
+            return _text({"error": "Invalid sort method"})
         
-        if sort == "hot":
-            posts = subreddit.hot(limit=limit)
-        elif sort == "new":
-            posts = subreddit.new(limit=limit)
-        elif sort == "top":
-            posts = subreddit.top(time_filter=time_filter, limit=limit)
-        elif sort == "rising":
-            posts = subreddit.rising(limit=limit)
-        elif sort == "controversial":
-            posts = subreddit.controversial(time_filter=time_filter, limit=limit)
-        else:
-            return {"error": "Invalid sort method"}
+        posts = _listing(f"/r/{subreddit_name}/{sort}", {"t": time_filter} if timed else None, limit)
+        posts = [child["data"] for child in posts]
         
-        result = []
-        for post in posts:
-            result.append({
-                "id": post.id,
-                "title": post.title,
-                "author": str(post.author) if post.author else "[deleted]",
-                "created_utc": post.created_utc,
-                "score": post.score,
-                "upvote_ratio": post.upvote_ratio,
-                "num_comments": post.num_comments,
-                "url": post.url,
-                "selftext": post.selftext,
-                "permalink": f"https://reddit.com{post.permalink}",
-                "is_video": post.is_video,
-                "is_self": post.is_self,
-                "stickied": post.stickied,
-                "locked": post.locked,
-                "nsfw": post.over_18,
-                "spoiler": post.spoiler,
-                "distinguished": post.distinguished,
-                "link_flair_text": post.link_flair_text,
-                "author_flair_text": post.author_flair_text,
-                "gilded": post.gilded,
-                "total_awards_received": post.total_awards_received
+        # Narrow the copied and derived fields once, not per post
+        keys = _POST_KEYS if fields is None else [key for key in _POST_KEYS if key in fields]
+        derived = {
+            name: build for name, build in _POST_DERIVED.items()
+            if fields is None or name in fields
+        }
+        
+        if columnar:
+            return _text({
+                **{key: [post.get(key) for post in posts] for key in keys},
+                **{name: [build(post) for post in posts] for name, build in derived.items()}
             })
         
-        return result
+        return _text([
+            {
+                **{key: post.get(key) for key in keys},
+                **{name: build(post) for name, build in derived.items()}
+            }
+            for post in posts
+        ])
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def search_subreddits(query: str, limit: int = 25) -> List[Dict[str, Any]]:
+def search_subreddits(query: str, limit: int = 25) -> TextContent:
     """
     Search for subreddits
     
@@ -187,25 +491,39 @@ def search_subreddits(query: str, limit: int = 25) -> List[Dict[str, Any]]:
     Returns:
         List of matching subreddits
     """
-    reddit = init_reddit()
     try:
-        subreddits = reddit.subreddits.search(query, limit=limit)
+        subreddits = _listing("/subreddits/search", {"q": query}, limit)
         result = []
-        for sub in subreddits:
+        for child in subreddits:
+            sub = child["data"]
             result.append({
-                "name": sub.display_name,
-                "title": sub.title,
-                "description": sub.public_description,
-                "subscribers": sub.subscribers,
-                "over_18": sub.over18,
-                "url": f"https://reddit.com{sub.url}"
+                "name": sub.get("display_name"),
+                "title": sub.get("title"),
+                "description": sub.get("public_description"),
+                "subscribers": sub.get("subscribers"),
+                "over_18": sub.get("over18"),
+                "url": _REDDIT_BASE + sub["url"]
             })
-        return result
+        return _text(result)
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
+
+@cached(_SUBREDDIT_RULES_CACHE, lock=_CACHE_LOCK)
+def _fetch_subreddit_rules(subreddit_name: str) -> List[Dict[str, Any]]:
+    """Fetch and shape subreddit rules, cached for five minutes"""
+    result = []
+    for rule in _subreddit(subreddit_name).rules():
+        result.append({
+            "short_name": rule.get("short_name"),
+            "description": rule.get("description"),
+            "kind": rule.get("kind"),
+            "violation_reason": rule.get("violation_reason"),
+            "created_utc": rule.get("created_utc")
+        })
+    return result
 
 @mcp.tool()
-def get_subreddit_rules(subreddit_name: str) -> List[Dict[str, Any]]:
+def get_subreddit_rules(subreddit_name: str) -> TextContent:
     """
     Get rules of a subreddit
     
@@ -215,25 +533,25 @@ def get_subreddit_rules(subreddit_name: str) -> List[Dict[str, Any]]:
     Returns:
         List of subreddit rules
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
-        rules = subreddit.rules()
-        result = []
-        for rule in rules:
-            result.append({
-                "short_name": rule.get("short_name"),
-                "description": rule.get("description"),
-                "kind": rule.get("kind"),
-                "violation_reason": rule.get("violation_reason"),
-                "created_utc": rule.get("created_utc")
-            })
-        return result
+        return _text(_fetch_subreddit_rules(subreddit_name))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
+
+@cached(_SUBREDDIT_MODERATORS_CACHE, lock=_CACHE_LOCK)
+def _fetch_subreddit_moderators(subreddit_name: str) -> List[Dict[str, Any]]:
+    """Fetch and shape subreddit moderators, cached for five minutes"""
+    result = []
+    for mod in _subreddit(subreddit_name).moderator():
+        result.append({
+            "name": str(mod),
+            "mod_permissions": mod.mod_permissions,
+            "added_date": mod.date
+        })
+    return result
 
 @mcp.tool()
-def get_subreddit_moderators(subreddit_name: str) -> List[Dict[str, Any]]:
+def get_subreddit_moderators(subreddit_name: str) -> TextContent:
     """
     Get moderators of a subreddit
     
@@ -243,27 +561,47 @@ def get_subreddit_moderators(subreddit_name: str) -> List[Dict[str, Any]]:
     Returns:
         List of subreddit moderators
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
-        moderators = subreddit.moderator()
-        result = []
-        for mod in moderators:
-            result.append({
-                "name": str(mod),
-                "mod_permissions": mod.mod_permissions,
-                "added_date": mod.date
-            })
-        return result
+        return _text(_fetch_subreddit_moderators(subreddit_name))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 # ============================================================================
 # POST OPERATIONS
 # ============================================================================
 
+def _post_details(submission: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a raw post into the get_post result"""
+    return {
+        "id": submission.get("id"),
+        "title": submission.get("title"),
+        "author": submission.get("author"),
+        "subreddit": submission.get("subreddit"),
+        "created_utc": submission.get("created_utc"),
+        "score": submission.get("score"),
+        "upvote_ratio": submission.get("upvote_ratio"),
+        "num_comments": submission.get("num_comments"),
+        "url": submission.get("url"),
+        "selftext": submission.get("selftext"),
+        "permalink": _REDDIT_BASE + submission["permalink"],
+        "is_video": submission.get("is_video"),
+        "is_self": submission.get("is_self"),
+        "stickied": submission.get("stickied"),
+        "locked": submission.get("locked"),
+        "nsfw": submission.get("over_18"),
+        "spoiler": submission.get("spoiler"),
+        "distinguished": submission.get("distinguished"),
+        "link_flair_text": submission.get("link_flair_text"),
+        "author_flair_text": submission.get("author_flair_text"),
+        "gilded": submission.get("gilded"),
+        "total_awards_received": submission.get("total_awards_received"),
+        "edited": submission.get("edited"),
+        "num_crossposts": submission.get("num_crossposts"),
+        "view_count": submission.get("view_count")
+    }
+
 @mcp.tool()
-def get_post(post_id: str) -> Dict[str, Any]:
+def get_post(post_id: str) -> TextContent:
     """
     Get details of a specific post
     
@@ -273,45 +611,47 @@ def get_post(post_id: str) -> Dict[str, Any]:
     Returns:
         Post details
     """
-    reddit = init_reddit()
     try:
         if post_id.startswith("http"):
-            submission = reddit.submission(url=post_id)
-        else:
-            submission = reddit.submission(id=post_id)
+            post_id = Submission.id_from_url(post_id)
         
-        return {
-            "id": submission.id,
-            "title": submission.title,
-            "author": str(submission.author) if submission.author else "[deleted]",
-            "subreddit": str(submission.subreddit),
-            "created_utc": submission.created_utc,
-            "score": submission.score,
-            "upvote_ratio": submission.upvote_ratio,
-            "num_comments": submission.num_comments,
-            "url": submission.url,
-            "selftext": submission.selftext,
-            "permalink": f"https://reddit.com{submission.permalink}",
-            "is_video": submission.is_video,
-            "is_self": submission.is_self,
-            "stickied": submission.stickied,
-            "locked": submission.locked,
-            "nsfw": submission.over_18,
-            "spoiler": submission.spoiler,
-            "distinguished": submission.distinguished,
-            "link_flair_text": submission.link_flair_text,
-            "author_flair_text": submission.author_flair_text,
-            "gilded": submission.gilded,
-            "total_awards_received": submission.total_awards_received,
-            "edited": submission.edited,
-            "num_crossposts": submission.num_crossposts,
-            "view_count": submission.view_count
-        }
+        children = _get("/api/info", {"id": f"t3_{post_id}"})["data"]["children"]
+        if not children:
+            return _text({"error": f"Post {post_id} not found"})
+        submission = children[0]["data"]
+        
+        return _text(_post_details(submission))
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
+
+@mcp.tool()
+def get_posts(post_ids: List[str]) -> TextContent:
+    """
+    Get details of several posts at once
+    
+    Args:
+        post_ids: Reddit post IDs or full URLs
+    
+    Returns:
+        Post details for each ID, in input order
+    """
+    try:
+        post_ids = [
+            Submission.id_from_url(post_id) if post_id.startswith("http") else post_id
+            for post_id in post_ids
+        ]
+        found = {submission["id"]: submission for submission in _fetch_many(post_ids, "t3_")}
+        
+        return _text([
+            _post_details(found[post_id]) if post_id in found
+            else {"error": f"Post {post_id} not found"}
+            for post_id in post_ids
+        ])
+    except Exception as e:
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_post_comments(post_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+def get_post_comments(post_id: str, limit: Optional[int] = None) -> TextContent:
     """
     Get all comments from a post
     
@@ -322,42 +662,15 @@ def get_post_comments(post_id: str, limit: Optional[int] = None) -> List[Dict[st
     Returns:
         List of comments with nested replies
     """
-    reddit = init_reddit()
     try:
         if post_id.startswith("http"):
-            submission = reddit.submission(url=post_id)
-        else:
-            submission = reddit.submission(id=post_id)
+            post_id = Submission.id_from_url(post_id)
         
-        submission.comments.replace_more(limit=limit)
-        
-        def parse_comment(comment):
-            if isinstance(comment, praw.models.MoreComments):
-                return None
-            
-            return {
-                "id": comment.id,
-                "author": str(comment.author) if comment.author else "[deleted]",
-                "body": comment.body,
-                "score": comment.score,
-                "created_utc": comment.created_utc,
-                "edited": comment.edited,
-                "is_submitter": comment.is_submitter,
-                "stickied": comment.stickied,
-                "distinguished": comment.distinguished,
-                "gilded": comment.gilded,
-                "replies": [parse_comment(reply) for reply in comment.replies if parse_comment(reply)]
-            }
-        
-        comments = []
-        for top_level_comment in submission.comments:
-            parsed = parse_comment(top_level_comment)
-            if parsed:
-                comments.append(parsed)
-        
-        return comments
+        forest = _get(f"/comments/{post_id}", _COMMENT_PARAMS)[1]["data"]["children"]
+        _expand_more(post_id, forest, limit)
+        return _text(_comment_tree(forest))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
 def submit_text_post(
@@ -367,7 +680,7 @@ def submit_text_post(
     flair_id: Optional[str] = None,
     nsfw: bool = False,
     spoiler: bool = False
-) -> Dict[str, Any]:
+) -> TextContent:
     """
     Submit a text post to a subreddit
     
@@ -382,9 +695,8 @@ def submit_text_post(
     Returns:
         Submission details
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        subreddit = _subreddit(subreddit_name)
         submission = subreddit.submit(
             title=title,
             selftext=text,
@@ -393,14 +705,14 @@ def submit_text_post(
             spoiler=spoiler
         )
         
-        return {
+        return _text({
             "id": submission.id,
             "title": submission.title,
-            "url": f"https://reddit.com{submission.permalink}",
+            "url": _REDDIT_BASE + submission.permalink,
             "created_utc": submission.created_utc
-        }
+        })
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
 def submit_link_post(
@@ -410,7 +722,7 @@ def submit_link_post(
     flair_id: Optional[str] = None,
     nsfw: bool = False,
     spoiler: bool = False
-) -> Dict[str, Any]:
+) -> TextContent:
     """
     Submit a link post to a subreddit
     
@@ -425,9 +737,8 @@ def submit_link_post(
     Returns:
         Submission details
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        subreddit = _subreddit(subreddit_name)
         submission = subreddit.submit(
             title=title,
             url=url,
@@ -436,17 +747,17 @@ def submit_link_post(
             spoiler=spoiler
         )
         
-        return {
+        return _text({
             "id": submission.id,
             "title": submission.title,
-            "url": f"https://reddit.com{submission.permalink}",
+            "url": _REDDIT_BASE + submission.permalink,
             "created_utc": submission.created_utc
-        }
+        })
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def delete_post(post_id: str) -> Dict[str, Any]:
+def delete_post(post_id: str) -> TextContent:
     """
     Delete a post (must be author)
     
@@ -456,20 +767,19 @@ def delete_post(post_id: str) -> Dict[str, Any]:
     Returns:
         Deletion status
     """
-    reddit = init_reddit()
     try:
-        submission = reddit.submission(id=post_id)
+        submission = _get_submission(post_id)
         submission.delete()
-        return {"success": True, "message": f"Post {post_id} deleted"}
+        return _text({"success": True, "message": f"Post {post_id} deleted"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 # ============================================================================
 # COMMENT OPERATIONS
 # ============================================================================
 
 @mcp.tool()
-def reply_to_post(post_id: str, text: str) -> Dict[str, Any]:
+def reply_to_post(post_id: str, text: str) -> TextContent:
     """
     Reply to a post with a comment
     
@@ -480,21 +790,20 @@ def reply_to_post(post_id: str, text: str) -> Dict[str, Any]:
     Returns:
         Comment details
     """
-    reddit = init_reddit()
     try:
-        submission = reddit.submission(id=post_id)
+        submission = _get_submission(post_id)
         comment = submission.reply(text)
-        return {
+        return _text({
             "id": comment.id,
             "body": comment.body,
-            "permalink": f"https://reddit.com{comment.permalink}",
+            "permalink": _REDDIT_BASE + comment.permalink,
             "created_utc": comment.created_utc
-        }
+        })
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def reply_to_comment(comment_id: str, text: str) -> Dict[str, Any]:
+def reply_to_comment(comment_id: str, text: str) -> TextContent:
     """
     Reply to a comment
     
@@ -505,21 +814,58 @@ def reply_to_comment(comment_id: str, text: str) -> Dict[str, Any]:
     Returns:
         Reply details
     """
-    reddit = init_reddit()
     try:
-        comment = reddit.comment(id=comment_id)
+        comment = _get_comment(comment_id)
         reply = comment.reply(text)
-        return {
+        return _text({
             "id": reply.id,
             "body": reply.body,
-            "permalink": f"https://reddit.com{reply.permalink}",
+            "permalink": _REDDIT_BASE + reply.permalink,
             "created_utc": reply.created_utc
+        })
+    except Exception as e:
+        return _text({"error": str(e)})
+
+def _reply_one(item: Dict[str, str]) -> Dict[str, Any]:
+    """Post one bulk_reply item, returning its reply details or error"""
+    try:
+        if item.get("type", "post") == "post":
+            thing_id = f"t3_{item['id']}"
+        elif item["type"] == "comment":
+            thing_id = f"t1_{item['id']}"
+        else:
+            return {"id": item.get("id"), "error": "Invalid item type"}
+        
+        response = _post("/api/comment", {"thing_id": thing_id, "text": item["text"]})
+        reply = response["json"]["data"]["things"][0]["data"]
+        return {
+            "id": reply["id"],
+            "body": reply["body"],
+            "permalink": _REDDIT_BASE + reply["permalink"],
+            "created_utc": reply["created_utc"]
         }
     except Exception as e:
-        return {"error": str(e)}
+        return {"id": item.get("id"), "error": str(e)}
+
+@mcp.tool()
+def bulk_reply(replies: List[Dict[str, str]]) -> TextContent:
+    """
+    Reply to several posts and comments at once
+    
+    Args:
+        replies: Items with "id", "text" and optional "type" ("post" or "comment", default "post")
+    
+    Returns:
+        Reply details or error for each item, in input order
+    """
+    try:
+        # Replies are independent, so post them concurrently on the worker pool
+        return _text(list(_EXECUTOR.map(_reply_one, replies)))
+    except Exception as e:
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def edit_comment(comment_id: str, text: str) -> Dict[str, Any]:
+def edit_comment(comment_id: str, text: str) -> TextContent:
     """
     Edit a comment (must be author)
     
@@ -530,16 +876,15 @@ def edit_comment(comment_id: str, text: str) -> Dict[str, Any]:
     Returns:
         Edit status
     """
-    reddit = init_reddit()
     try:
-        comment = reddit.comment(id=comment_id)
+        comment = _get_comment(comment_id)
         comment.edit(text)
-        return {"success": True, "message": f"Comment {comment_id} edited"}
+        return _text({"success": True, "message": f"Comment {comment_id} edited"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def delete_comment(comment_id: str) -> Dict[str, Any]:
+def delete_comment(comment_id: str) -> TextContent:
     """
     Delete a comment (must be author)
     
@@ -549,20 +894,44 @@ def delete_comment(comment_id: str) -> Dict[str, Any]:
     Returns:
         Deletion status
     """
-    reddit = init_reddit()
     try:
-        comment = reddit.comment(id=comment_id)
+        comment = _get_comment(comment_id)
         comment.delete()
-        return {"success": True, "message": f"Comment {comment_id} deleted"}
+        return _text({"success": True, "message": f"Comment {comment_id} deleted"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 # ============================================================================
 # USER OPERATIONS
 # ============================================================================
 
+@cached(_USER_INFO_CACHE, lock=_CACHE_LOCK)
+def _fetch_user_info(username: str) -> Dict[str, Any]:
+    """Fetch and shape a user profile, cached for a minute"""
+    user = _get(f"/user/{username}/about")["data"]
+    profile = user.get("subreddit") or {}
+    return {
+        "name": user.get("name"),
+        "id": user.get("id"),
+        "created_utc": user.get("created_utc"),
+        "link_karma": user.get("link_karma"),
+        "comment_karma": user.get("comment_karma"),
+        "total_karma": user.get("total_karma"),
+        "is_gold": user.get("is_gold"),
+        "is_mod": user.get("is_mod"),
+        "is_employee": user.get("is_employee"),
+        "has_verified_email": user.get("has_verified_email"),
+        "icon_img": user.get("icon_img"),
+        "subreddit": {
+            "display_name": profile.get("display_name"),
+            "title": profile.get("title"),
+            "description": profile.get("public_description"),
+            "subscribers": profile.get("subscribers")
+        }
+    }
+
 @mcp.tool()
-def get_user_info(username: str) -> Dict[str, Any]:
+def get_user_info(username: str) -> TextContent:
     """
     Get information about a Reddit user
     
@@ -572,33 +941,13 @@ def get_user_info(username: str) -> Dict[str, Any]:
     Returns:
         User profile information
     """
-    reddit = init_reddit()
     try:
-        user = reddit.redditor(username)
-        return {
-            "name": user.name,
-            "id": user.id,
-            "created_utc": user.created_utc,
-            "link_karma": user.link_karma,
-            "comment_karma": user.comment_karma,
-            "total_karma": user.total_karma,
-            "is_gold": user.is_gold,
-            "is_mod": user.is_mod,
-            "is_employee": user.is_employee,
-            "has_verified_email": user.has_verified_email,
-            "icon_img": user.icon_img,
-            "subreddit": {
-                "display_name": user.subreddit.display_name,
-                "title": user.subreddit.title,
-                "description": user.subreddit.public_description,
-                "subscribers": user.subreddit.subscribers
-            }
-        }
+        return _text(_fetch_user_info(username))
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def get_user_posts(username: str, sort: str = "new", limit: int = 25) -> List[Dict[str, Any]]:
+def get_user_posts(username: str, sort: str = "new", limit: int = 25) -> TextContent:
     """
     Get posts by a user
     
@@ -610,39 +959,27 @@ def get_user_posts(username: str, sort: str = "new", limit: int = 25) -> List[Di
     Returns:
         List of user's posts
     """
-    reddit = init_reddit()
     try:
-        user = reddit.redditor(username)
+        try:
+            params = _USER_SORTS[sort]
+        except KeyError:
+            return _text([{"error": "Invalid sort method"}])
         
-        if sort == "new":
-            submissions = user.submissions.new(limit=limit)
-        elif sort == "top":
-            submissions = user.submissions.top(limit=limit)
-        elif sort == "hot":
-            submissions = user.submissions.hot(limit=limit)
-        else:
-            return [{"error": "Invalid sort method"}]
+        submissions = _listing(f"/user/{username}/submitted", params, limit)
         
-        result = []
-        for post in submissions:
-            result.append({
-                "id": post.id,
-                "title": post.title,
-                "subreddit": str(post.subreddit),
-                "created_utc": post.created_utc,
-                "score": post.score,
-                "num_comments": post.num_comments,
-                "url": post.url,
-                "selftext": post.selftext[:200] if post.selftext else None,
-                "permalink": f"https://reddit.com{post.permalink}"
-            })
-        
-        return result
+        return _text([
+            {
+                **{key: post.get(key) for key in _USER_POST_KEYS},
+                "selftext": post["selftext"][:200] if post.get("selftext") else None,
+                "permalink": _REDDIT_BASE + post["permalink"]
+            }
+            for post in (child["data"] for child in submissions)
+        ])
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_user_comments(username: str, sort: str = "new", limit: int = 25) -> List[Dict[str, Any]]:
+def get_user_comments(username: str, sort: str = "new", limit: int = 25) -> TextContent:
     """
     Get comments by a user
     
@@ -654,37 +991,53 @@ def get_user_comments(username: str, sort: str = "new", limit: int = 25) -> List
     Returns:
         List of user's comments
     """
-    reddit = init_reddit()
     try:
-        user = reddit.redditor(username)
+        try:
+            params = _USER_SORTS[sort]
+        except KeyError:
+            return _text([{"error": "Invalid sort method"}])
         
-        if sort == "new":
-            comments = user.comments.new(limit=limit)
-        elif sort == "top":
-            comments = user.comments.top(limit=limit)
-        elif sort == "hot":
-            comments = user.comments.hot(limit=limit)
-        else:
-            return [{"error": "Invalid sort method"}]
-        
-        result = []
-        for comment in comments:
-            result.append({
-                "id": comment.id,
-                "body": comment.body[:200],
-                "subreddit": str(comment.subreddit),
-                "created_utc": comment.created_utc,
-                "score": comment.score,
-                "permalink": f"https://reddit.com{comment.permalink}",
-                "submission_title": comment.submission.title if hasattr(comment, 'submission') else None
-            })
+        comments = _listing(f"/user/{username}/comments", params, limit)
         
-        return result
+        # User comment listings carry the parent post title as link_title
+        return _text([
+            {
+                "id": comment["id"],
+                "body": comment["body"][:200],
+                "subreddit": comment["subreddit"],
+                "created_utc": comment["created_utc"],
+                "score": comment["score"],
+                "permalink": _REDDIT_BASE + comment["permalink"],
+                "submission_title": comment.get("link_title")
+            }
+            for comment in (child["data"] for child in comments)
+        ])
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
+
+@cached(_USER_KARMA_CACHE, lock=_CACHE_LOCK)
+def _fetch_user_karma(username: str) -> Dict[str, Any]:
+    """Fetch and shape a user's karma breakdown, cached for a minute"""
+    user = _REDDIT.redditor(username)
+    karma = user.karma()
+    
+    result = {
+        "total_karma": user.total_karma,
+        "link_karma": user.link_karma,
+        "comment_karma": user.comment_karma,
+        "subreddit_karma": {}
+    }
+    
+    for subreddit, karma_dict in karma.items():
+        result["subreddit_karma"][str(subreddit)] = {
+            "link_karma": karma_dict['link_karma'],
+            "comment_karma": karma_dict['comment_karma']
+        }
+    
+    return result
 
 @mcp.tool()
-def get_user_karma(username: str) -> Dict[str, Any]:
+def get_user_karma(username: str) -> TextContent:
     """
     Get karma breakdown by subreddit for a user
     
@@ -694,30 +1047,13 @@ def get_user_karma(username: str) -> Dict[str, Any]:
     Returns:
         Karma breakdown by subreddit
     """
-    reddit = init_reddit()
     try:
-        user = reddit.redditor(username)
-        karma = user.karma()
-        
-        result = {
-            "total_karma": user.total_karma,
-            "link_karma": user.link_karma,
-            "comment_karma": user.comment_karma,
-            "subreddit_karma": {}
-        }
-        
-        for subreddit, karma_dict in karma.items():
-            result["subreddit_karma"][str(subreddit)] = {
-                "link_karma": karma_dict['link_karma'],
-                "comment_karma": karma_dict['comment_karma']
-            }
-        
-        return result
+        return _text(_fetch_user_karma(username))
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def get_my_saved(limit: int = 25) -> List[Dict[str, Any]]:
+def get_my_saved(limit: int = 25) -> TextContent:
     """
     Get saved posts and comments for authenticated user
     
@@ -727,39 +1063,13 @@ def get_my_saved(limit: int = 25) -> List[Dict[str, Any]]:
     Returns:
         List of saved items
     """
-    reddit = init_reddit()
     try:
-        saved = reddit.user.me().saved(limit=limit)
-        result = []
-        
-        for item in saved:
-            if isinstance(item, Submission):
-                result.append({
-                    "type": "post",
-                    "id": item.id,
-                    "title": item.title,
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc,
-                    "permalink": f"https://reddit.com{item.permalink}"
-                })
-            elif isinstance(item, Comment):
-                result.append({
-                    "type": "comment",
-                    "id": item.id,
-                    "body": item.body[:200],
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc,
-                    "permalink": f"https://reddit.com{item.permalink}"
-                })
-        
-        return result
+        return _text(_mixed_listing(f"/user/{_USERNAME}/saved", limit))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_my_upvoted(limit: int = 25) -> List[Dict[str, Any]]:
+def get_my_upvoted(limit: int = 25) -> TextContent:
     """
     Get upvoted posts and comments for authenticated user
     
@@ -769,39 +1079,13 @@ def get_my_upvoted(limit: int = 25) -> List[Dict[str, Any]]:
     Returns:
         List of upvoted items
     """
-    reddit = init_reddit()
     try:
-        upvoted = reddit.user.me().upvoted(limit=limit)
-        result = []
-        
-        for item in upvoted:
-            if isinstance(item, Submission):
-                result.append({
-                    "type": "post",
-                    "id": item.id,
-                    "title": item.title,
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc,
-                    "permalink": f"https://reddit.com{item.permalink}"
-                })
-            elif isinstance(item, Comment):
-                result.append({
-                    "type": "comment",
-                    "id": item.id,
-                    "body": item.body[:200],
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc,
-                    "permalink": f"https://reddit.com{item.permalink}"
-                })
-        
-        return result
+        return _text(_mixed_listing(f"/user/{_USERNAME}/upvoted", limit))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_my_downvoted(limit: int = 25) -> List[Dict[str, Any]]:
+def get_my_downvoted(limit: int = 25) -> TextContent:
     """
     Get downvoted posts and comments for authenticated user
     
@@ -811,43 +1095,51 @@ def get_my_downvoted(limit: int = 25) -> List[Dict[str, Any]]:
     Returns:
         List of downvoted items
     """
-    reddit = init_reddit()
     try:
-        downvoted = reddit.user.me().downvoted(limit=limit)
-        result = []
-        
-        for item in downvoted:
-            if isinstance(item, Submission):
-                result.append({
-                    "type": "post",
-                    "id": item.id,
-                    "title": item.title,
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc,
-                    "permalink": f"https://reddit.com{item.permalink}"
-                })
-            elif isinstance(item, Comment):
-                result.append({
-                    "type": "comment",
-                    "id": item.id,
-                    "body": item.body[:200],
-                    "subreddit": str(item.subreddit),
-                    "score": item.score,
-                    "created_utc": item.created_utc,
-                    "permalink": f"https://reddit.com{item.permalink}"
-                })
-        
-        return result
+        return _text(_mixed_listing(f"/user/{_USERNAME}/downvoted", limit))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 # ============================================================================
 # VOTING AND INTERACTION OPERATIONS
 # ============================================================================
 
+# Lazy proxy builders for the item types accepted by the voting and save tools
+ItemType = Literal["post", "comment"]
+_ITEM_GETTERS = {"post": _get_submission, "comment": _get_comment}
+
+# PRAW action -> success message, formatted with the item type and id; shared
+# by the single-item and bulk tools so their messages always match
+_ACTION_MESSAGES = {
+    "upvote": "{} {} upvoted",
+    "downvote": "{} {} downvoted",
+    "clear_vote": "Vote cleared on {} {}",
+    "save": "{} {} saved",
+    "unsave": "{} {} unsaved"
+}
+
+# Vote direction accepted by bulk_vote -> PRAW action
+_VOTE_ACTIONS = {1: "upvote", -1: "downvote", 0: "clear_vote"}
+
+def _act_on_item(item_id: str, item_type: ItemType, action: str) -> Dict[str, Any]:
+    """Call a no-argument PRAW action on a post or comment and report the outcome"""
+    # item_type is a Literal in every tool signature, so the MCP schema has
+    # already rejected anything but "post" and "comment"
+    try:
+        getattr(_ITEM_GETTERS[item_type](item_id), action)()
+        return {"success": True, "message": _ACTION_MESSAGES[action].format(item_type, item_id)}
+    except Exception as e:
+        return {"error": str(e)}
+
+def _act_on_items(item_ids: List[str], item_type: ItemType, action: str) -> List[Dict[str, Any]]:
+    """Run _act_on_item for each id concurrently"""
+    return list(_EXECUTOR.map(
+        lambda item_id: {"id": item_id, **_act_on_item(item_id, item_type, action)},
+        item_ids
+    ))
+
 @mcp.tool()
-def upvote(item_id: str, item_type: str = "post") -> Dict[str, Any]:
+def upvote(item_id: str, item_type: ItemType = "post") -> TextContent:
     """
     Upvote a post or comment
     
@@ -858,22 +1150,10 @@ def upvote(item_id: str, item_type: str = "post") -> Dict[str, Any]:
     Returns:
         Vote status
     """
-    reddit = init_reddit()
-    try:
-        if item_type == "post":
-            item = reddit.submission(id=item_id)
-        elif item_type == "comment":
-            item = reddit.comment(id=item_id)
-        else:
-            return {"error": "Invalid item_type. Use 'post' or 'comment'"}
-        
-        item.upvote()
-        return {"success": True, "message": f"{item_type} {item_id} upvoted"}
-    except Exception as e:
-        return {"error": str(e)}
+    return _text(_act_on_item(item_id, item_type, "upvote"))
 
 @mcp.tool()
-def downvote(item_id: str, item_type: str = "post") -> Dict[str, Any]:
+def downvote(item_id: str, item_type: ItemType = "post") -> TextContent:
     """
     Downvote a post or comment
     
@@ -884,22 +1164,10 @@ def downvote(item_id: str, item_type: str = "post") -> Dict[str, Any]:
     Returns:
         Vote status
     """
-    reddit = init_reddit()
-    try:
-        if item_type == "post":
-            item = reddit.submission(id=item_id)
-        elif item_type == "comment":
-            item = reddit.comment(id=item_id)
-        else:
-            return {"error": "Invalid item_type. Use 'post' or 'comment'"}
-        
-        item.downvote()
-        return {"success": True, "message": f"{item_type} {item_id} downvoted"}
-    except Exception as e:
-        return {"error": str(e)}
+    return _text(_act_on_item(item_id, item_type, "downvote"))
 
 @mcp.tool()
-def clear_vote(item_id: str, item_type: str = "post") -> Dict[str, Any]:
+def clear_vote(item_id: str, item_type: ItemType = "post") -> TextContent:
     """
     Clear vote on a post or comment
     
@@ -910,22 +1178,10 @@ def clear_vote(item_id: str, item_type: str = "post") -> Dict[str, Any]:
     Returns:
         Vote status
     """
-    reddit = init_reddit()
-    try:
-        if item_type == "post":
-            item = reddit.submission(id=item_id)
-        elif item_type == "comment":
-            item = reddit.comment(id=item_id)
-        else:
-            return {"error": "Invalid item_type. Use 'post' or 'comment'"}
-        
-        item.clear_vote()
-        return {"success": True, "message": f"Vote cleared on {item_type} {item_id}"}
-    except Exception as e:
-        return {"error": str(e)}
+    return _text(_act_on_item(item_id, item_type, "clear_vote"))
 
 @mcp.tool()
-def save_item(item_id: str, item_type: str = "post") -> Dict[str, Any]:
+def save_item(item_id: str, item_type: ItemType = "post") -> TextContent:
     """
     Save a post or comment
     
@@ -936,22 +1192,10 @@ def save_item(item_id: str, item_type: str = "post") -> Dict[str, Any]:
     Returns:
         Save status
     """
-    reddit = init_reddit()
-    try:
-        if item_type == "post":
-            item = reddit.submission(id=item_id)
-        elif item_type == "comment":
-            item = reddit.comment(id=item_id)
-        else:
-            return {"error": "Invalid item_type. Use 'post' or 'comment'"}
-        
-        item.save()
-        return {"success": True, "message": f"{item_type} {item_id} saved"}
-    except Exception as e:
-        return {"error": str(e)}
+    return _text(_act_on_item(item_id, item_type, "save"))
 
 @mcp.tool()
-def unsave_item(item_id: str, item_type: str = "post") -> Dict[str, Any]:
+def unsave_item(item_id: str, item_type: ItemType = "post") -> TextContent:
     """
     Unsave a post or comment
     
@@ -962,22 +1206,10 @@ def unsave_item(item_id: str, item_type: str = "post") -> Dict[str, Any]:
     Returns:
         Unsave status
     """
-    reddit = init_reddit()
-    try:
-        if item_type == "post":
-            item = reddit.submission(id=item_id)
-        elif item_type == "comment":
-            item = reddit.comment(id=item_id)
-        else:
-            return {"error": "Invalid item_type. Use 'post' or 'comment'"}
-        
-        item.unsave()
-        return {"success": True, "message": f"{item_type} {item_id} unsaved"}
-    except Exception as e:
-        return {"error": str(e)}
+    return _text(_act_on_item(item_id, item_type, "unsave"))
 
 @mcp.tool()
-def hide_post(post_id: str) -> Dict[str, Any]:
+def hide_post(post_id: str) -> TextContent:
     """
     Hide a post from feed
     
@@ -987,16 +1219,15 @@ def hide_post(post_id: str) -> Dict[str, Any]:
     Returns:
         Hide status
     """
-    reddit = init_reddit()
     try:
-        submission = reddit.submission(id=post_id)
+        submission = _get_submission(post_id)
         submission.hide()
-        return {"success": True, "message": f"Post {post_id} hidden"}
+        return _text({"success": True, "message": f"Post {post_id} hidden"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def unhide_post(post_id: str) -> Dict[str, Any]:
+def unhide_post(post_id: str) -> TextContent:
     """
     Unhide a post
     
@@ -1006,25 +1237,113 @@ def unhide_post(post_id: str) -> Dict[str, Any]:
     Returns:
         Unhide status
     """
-    reddit = init_reddit()
     try:
-        submission = reddit.submission(id=post_id)
+        submission = _get_submission(post_id)
         submission.unhide()
-        return {"success": True, "message": f"Post {post_id} unhidden"}
+        return _text({"success": True, "message": f"Post {post_id} unhidden"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
+
+@mcp.tool()
+def bulk_vote(
+    item_ids: List[str],
+    direction: Literal[1, -1, 0] = 1,
+    item_type: ItemType = "post"
+) -> TextContent:
+    """
+    Vote on several posts or comments at once
+    
+    Args:
+        item_ids: Reddit post or comment IDs
+        direction: 1 to upvote, -1 to downvote, 0 to clear the vote
+        item_type: Type of the items ("post" or "comment")
+    
+    Returns:
+        Vote status for each item, in input order
+    """
+    try:
+        return _text(_act_on_items(item_ids, item_type, _VOTE_ACTIONS[direction]))
+    except Exception as e:
+        return _text([{"error": str(e)}])
+
+@mcp.tool()
+def bulk_save(item_ids: List[str], item_type: ItemType = "post") -> TextContent:
+    """
+    Save several posts or comments at once
+    
+    Args:
+        item_ids: Reddit post or comment IDs
+        item_type: Type of the items ("post" or "comment")
+    
+    Returns:
+        Save status for each item, in input order
+    """
+    try:
+        return _text(_act_on_items(item_ids, item_type, "save"))
+    except Exception as e:
+        return _text([{"error": str(e)}])
+
+@mcp.tool()
+def bulk_hide(post_ids: List[str]) -> TextContent:
+    """
+    Hide several posts from feed at once
+    
+    Args:
+        post_ids: Reddit post IDs
+    
+    Returns:
+        Hide status for each post, in input order
+    """
+    try:
+        # /api/hide takes up to 50 comma-separated fullnames per request
+        chunks = [post_ids[start:start + 50] for start in range(0, len(post_ids), 50)]
+        
+        def hide(chunk: List[str]) -> List[Dict[str, Any]]:
+            try:
+                _post("/api/hide", {"id": ",".join(f"t3_{post_id}" for post_id in chunk)})
+                return [
+                    {"id": post_id, "success": True, "message": f"Post {post_id} hidden"}
+                    for post_id in chunk
+                ]
+            except Exception as e:
+                return [{"id": post_id, "error": str(e)} for post_id in chunk]
+        
+        return _text([row for rows in _EXECUTOR.map(hide, chunks) for row in rows])
+    except Exception as e:
+        return _text([{"error": str(e)}])
 
 # ============================================================================
 # SEARCH OPERATIONS
 # ============================================================================
 
+@cached(_SEARCH_CACHE, lock=_CACHE_LOCK)
+def _search_posts(
+    subreddit_name: str,
+    query: str,
+    sort: str,
+    time_filter: str,
+    limit: int
+) -> List[Dict[str, Any]]:
+    """Search posts in a subreddit ("all" for everywhere), cached for a minute"""
+    results = _listing(
+        f"/r/{subreddit_name}/search",
+        {
+            "q": query,
+            "sort": sort,
+            "t": time_filter,
+            "restrict_sr": subreddit_name.lower() != "all"
+        },
+        limit
+    )
+    return [_feed_post(child["data"]) for child in results]
+
 @mcp.tool()
 def search_all_reddit(
     query: str,
     sort: str = "relevance",
     time_filter: str = "all",
     limit: int = 25
-) -> List[Dict[str, Any]]:
+) -> TextContent:
     """
     Search across all of Reddit
     
@@ -1037,33 +1356,10 @@ def search_all_reddit(
     Returns:
         List of search results
     """
-    reddit = init_reddit()
     try:
-        results = reddit.subreddit("all").search(
-            query, 
-            sort=sort, 
-            time_filter=time_filter, 
-            limit=limit
-        )
-        
-        result = []
-        for post in results:
-            result.append({
-                "id": post.id,
-                "title": post.title,
-                "author": str(post.author) if post.author else "[deleted]",
-                "subreddit": str(post.subreddit),
-                "created_utc": post.created_utc,
-                "score": post.score,
-                "num_comments": post.num_comments,
-                "url": post.url,
-                "selftext": post.selftext[:200] if post.selftext else None,
-                "permalink": f"https://reddit.com{post.permalink}"
-            })
-        
-        return result
+        return _text(_search_posts("all", query, sort, time_filter, limit))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
 def search_in_subreddit(
@@ -1072,7 +1368,7 @@ def search_in_subreddit(
     sort: str = "relevance",
     time_filter: str = "all",
     limit: int = 25
-) -> List[Dict[str, Any]]:
+) -> TextContent:
     """
     Search within a specific subreddit
     
@@ -1086,36 +1382,13 @@ def search_in_subreddit(
     Returns:
         List of search results
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
-        results = subreddit.search(
-            query, 
-            sort=sort, 
-            time_filter=time_filter, 
-            limit=limit
-        )
-        
-        result = []
-        for post in results:
-            result.append({
-                "id": post.id,
-                "title": post.title,
-                "author": str(post.author) if post.author else "[deleted]",
-                "created_utc": post.created_utc,
-                "score": post.score,
-                "num_comments": post.num_comments,
-                "url": post.url,
-                "selftext": post.selftext[:200] if post.selftext else None,
-                "permalink": f"https://reddit.com{post.permalink}"
-            })
-        
-        return result
+        return _text(_search_posts(subreddit_name, query, sort, time_filter, limit))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def search_users(query: str, limit: int = 25) -> List[Dict[str, Any]]:
+def search_users(query: str, limit: int = 25) -> TextContent:
     """
     Search for Reddit users
     
@@ -1126,7 +1399,7 @@ def search_users(query: str, limit: int = 25) -> List[Dict[str, Any]]:
     Returns:
         List of matching users
     """
-    reddit = init_reddit()
+    reddit = _REDDIT
     try:
         # PRAW doesn't have direct user search, so we search in r/all for the user
         # This is a workaround - for exact user match, use get_user_info
@@ -1136,19 +1409,19 @@ def search_users(query: str, limit: int = 25) -> List[Dict[str, Any]]:
         for item in results:
             result.append({
                 "name": item,
-                "url": f"https://reddit.com/u/{item}"
+                "url": f"{_REDDIT_BASE}/u/{item}"
             })
         
-        return result
+        return _text(result)
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 # ============================================================================
 # MESSAGING OPERATIONS
 # ============================================================================
 
 @mcp.tool()
-def get_inbox(filter_type: str = "all", limit: int = 25) -> List[Dict[str, Any]]:
+def get_inbox(filter_type: str = "all", limit: int = 25) -> TextContent:
     """
     Get inbox messages
     
@@ -1159,41 +1432,33 @@ def get_inbox(filter_type: str = "all", limit: int = 25) -> List[Dict[str, Any]]
     Returns:
         List of inbox messages
     """
-    reddit = init_reddit()
     try:
-        if filter_type == "all":
-            messages = reddit.inbox.all(limit=limit)
-        elif filter_type == "unread":
-            messages = reddit.inbox.unread(limit=limit)
-        elif filter_type == "messages":
-            messages = reddit.inbox.messages(limit=limit)
-        elif filter_type == "comments":
-            messages = reddit.inbox.comment_replies(limit=limit)
-        elif filter_type == "mentions":
-            messages = reddit.inbox.mentions(limit=limit)
-        else:
-            return [{"error": "Invalid filter_type"}]
+        try:
+            path, params = _INBOX_FILTERS[filter_type]
+        except KeyError:
+            return _text([{"error": "Invalid filter_type"}])
         
-        result = []
-        for message in messages:
-            result.append({
-                "id": message.id,
-                "subject": getattr(message, 'subject', None),
-                "body": message.body,
-                "author": str(message.author) if message.author else None,
-                "created_utc": message.created_utc,
-                "was_comment": message.was_comment,
-                "new": message.new,
-                "type": message.type,
-                "parent_id": message.parent_id if hasattr(message, 'parent_id') else None
-            })
+        messages = _listing(path, params, limit)
         
-        return result
+        return _text([
+            {
+                "id": message["id"],
+                "subject": message.get("subject"),
+                "body": message["body"],
+                "author": message.get("author"),
+                "created_utc": message["created_utc"],
+                "was_comment": message.get("was_comment"),
+                "new": message.get("new"),
+                "type": message.get("type"),
+                "parent_id": message.get("parent_id")
+            }
+            for message in (child["data"] for child in messages)
+        ])
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def send_message(username: str, subject: str, message: str) -> Dict[str, Any]:
+def send_message(username: str, subject: str, message: str) -> TextContent:
     """
     Send a private message to a user
     
@@ -1205,15 +1470,14 @@ def send_message(username: str, subject: str, message: str) -> Dict[str, Any]:
     Returns:
         Send status
     """
-    reddit = init_reddit()
     try:
-        reddit.redditor(username).message(subject, message)
-        return {"success": True, "message": f"Message sent to {username}"}
+        _get_redditor(username).message(subject, message)
+        return _text({"success": True, "message": f"Message sent to {username}"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def mark_message_read(message_id: str) -> Dict[str, Any]:
+def mark_message_read(message_id: str) -> TextContent:
     """
     Mark a message as read
     
@@ -1223,16 +1487,15 @@ def mark_message_read(message_id: str) -> Dict[str, Any]:
     Returns:
         Status
     """
-    reddit = init_reddit()
     try:
-        message = reddit.inbox.message(message_id)
-        message.mark_read()
-        return {"success": True, "message": f"Message {message_id} marked as read"}
+        # Marking only needs the fullname, so skip fetching the message first
+        _post("/api/read_message", {"id": f"t4_{message_id}"})
+        return _text({"success": True, "message": f"Message {message_id} marked as read"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def mark_message_unread(message_id: str) -> Dict[str, Any]:
+def mark_message_unread(message_id: str) -> TextContent:
     """
     Mark a message as unread
     
@@ -1242,20 +1505,19 @@ def mark_message_unread(message_id: str) -> Dict[str, Any]:
     Returns:
         Status
     """
-    reddit = init_reddit()
     try:
-        message = reddit.inbox.message(message_id)
-        message.mark_unread()
-        return {"success": True, "message": f"Message {message_id} marked as unread"}
+        # Marking only needs the fullname, so skip fetching the message first
+        _post("/api/unread_message", {"id": f"t4_{message_id}"})
+        return _text({"success": True, "message": f"Message {message_id} marked as unread"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 # ============================================================================
 # SUBSCRIPTION AND FOLLOWING OPERATIONS
 # ============================================================================
 
 @mcp.tool()
-def subscribe_subreddit(subreddit_name: str) -> Dict[str, Any]:
+def subscribe_subreddit(subreddit_name: str) -> TextContent:
     """
     Subscribe to a subreddit
     
@@ -1265,16 +1527,20 @@ def subscribe_subreddit(subreddit_name: str) -> Dict[str, Any]:
     Returns:
         Subscription status
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        subreddit = _subreddit(subreddit_name)
         subreddit.subscribe()
-        return {"success": True, "message": f"Subscribed to r/{subreddit_name}"}
+        # Cached info for this subreddit still carries the old user_is_subscriber,
+        # and cached subscription lists are missing or still include it
+        with _CACHE_LOCK:
+            _SUBREDDIT_INFO_CACHE.pop(hashkey(subreddit_name.lower()), None)
+            _SUBSCRIPTIONS_CACHE.clear()
+        return _text({"success": True, "message": f"Subscribed to r/{subreddit_name}"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def unsubscribe_subreddit(subreddit_name: str) -> Dict[str, Any]:
+def unsubscribe_subreddit(subreddit_name: str) -> TextContent:
     """
     Unsubscribe from a subreddit
     
@@ -1284,16 +1550,35 @@ def unsubscribe_subreddit(subreddit_name: str) -> Dict[str, Any]:
     Returns:
         Unsubscription status
     """
-    reddit = init_reddit()
     try:
-        subreddit = reddit.subreddit(subreddit_name)
+        subreddit = _subreddit(subreddit_name)
         subreddit.unsubscribe()
-        return {"success": True, "message": f"Unsubscribed from r/{subreddit_name}"}
+        # Cached info for this subreddit still carries the old user_is_subscriber,
+        # and cached subscription lists are missing or still include it
+        with _CACHE_LOCK:
+            _SUBREDDIT_INFO_CACHE.pop(hashkey(subreddit_name.lower()), None)
+            _SUBSCRIPTIONS_CACHE.clear()
+        return _text({"success": True, "message": f"Unsubscribed from r/{subreddit_name}"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
+
+@cached(_SUBSCRIPTIONS_CACHE, lock=_CACHE_LOCK)
+def _fetch_subscriptions(limit: int) -> List[Dict[str, Any]]:
+    """Fetch and shape the user's subscriptions, cached for a minute"""
+    # Each listing page carries up to 100 subreddits with these fields inline
+    return [
+        {
+            "name": sub.get("display_name"),
+            "title": sub.get("title"),
+            "description": sub.get("public_description"),
+            "subscribers": sub.get("subscribers"),
+            "url": _REDDIT_BASE + sub["url"]
+        }
+        for sub in (child["data"] for child in _listing("/subreddits/mine/subscriber", limit=limit))
+    ]
 
 @mcp.tool()
-def get_my_subscriptions(limit: int = 100) -> List[Dict[str, Any]]:
+def get_my_subscriptions(limit: int = 100) -> TextContent:
     """
     Get list of subscribed subreddits
     
@@ -1303,26 +1588,13 @@ def get_my_subscriptions(limit: int = 100) -> List[Dict[str, Any]]:
     Returns:
         List of subscribed subreddits
     """
-    reddit = init_reddit()
     try:
-        subscriptions = reddit.user.subreddits(limit=limit)
-        result = []
-        
-        for sub in subscriptions:
-            result.append({
-                "name": sub.display_name,
-                "title": sub.title,
-                "description": sub.public_description,
-                "subscribers": sub.subscribers,
-                "url": f"https://reddit.com{sub.url}"
-            })
-        
-        return result
+        return _text(_fetch_subscriptions(limit))
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def follow_user(username: str) -> Dict[str, Any]:
+def follow_user(username: str) -> TextContent:
     """
     Follow a Reddit user
     
@@ -1332,17 +1604,20 @@ def follow_user(username: str) -> Dict[str, Any]:
     Returns:
         Follow status
     """
-    reddit = init_reddit()
     try:
         # Follow user by subscribing to their profile subreddit
-        user = reddit.redditor(username)
+        user = _get_redditor(username)
+        # .subreddit fetches /user/{name}/about; the cached proxy reuses it
         user.subreddit.subscribe()
-        return {"success": True, "message": f"Now following u/{username}"}
+        # Followed profiles appear in the subscriber listing as u_<name>
+        with _CACHE_LOCK:
+            _SUBSCRIPTIONS_CACHE.clear()
+        return _text({"success": True, "message": f"Now following u/{username}"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 @mcp.tool()
-def unfollow_user(username: str) -> Dict[str, Any]:
+def unfollow_user(username: str) -> TextContent:
     """
     Unfollow a Reddit user
     
@@ -1352,49 +1627,53 @@ def unfollow_user(username: str) -> Dict[str, Any]:
     Returns:
         Unfollow status
     """
-    reddit = init_reddit()
     try:
         # Unfollow user by unsubscribing from their profile subreddit
-        user = reddit.redditor(username)
+        user = _get_redditor(username)
+        # .subreddit fetches /user/{name}/about; the cached proxy reuses it
         user.subreddit.unsubscribe()
-        return {"success": True, "message": f"Unfollowed u/{username}"}
+        # Followed profiles appear in the subscriber listing as u_<name>
+        with _CACHE_LOCK:
+            _SUBSCRIPTIONS_CACHE.clear()
+        return _text({"success": True, "message": f"Unfollowed u/{username}"})
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 # ============================================================================
 # ADDITIONAL REDDIT OPERATIONS
 # ============================================================================
 
+@cached(_TRENDING_CACHE, lock=_CACHE_LOCK)
+def _fetch_trending() -> List[Dict[str, Any]]:
+    """Fetch and shape trending subreddits, cached for five minutes"""
+    # Get popular subreddits as trending
+    result = []
+    for sub in _REDDIT.subreddits.popular(limit=10):
+        result.append({
+            "name": sub.display_name,
+            "title": sub.title,
+            "description": sub.public_description,
+            "subscribers": sub.subscribers,
+            "active_users": sub.active_user_count,
+            "url": _REDDIT_BASE + sub.url
+        })
+    return result
+
 @mcp.tool()
-def get_trending_subreddits() -> List[Dict[str, Any]]:
+def get_trending_subreddits() -> TextContent:
     """
     Get trending subreddits
     
     Returns:
         List of trending subreddits
     """
-    reddit = init_reddit()
     try:
-        # Get popular subreddits as trending
-        trending = reddit.subreddits.popular(limit=10)
-        result = []
-        
-        for sub in trending:
-            result.append({
-                "name": sub.display_name,
-                "title": sub.title,
-                "description": sub.public_description,
-                "subscribers": sub.subscribers,
-                "active_users": sub.active_user_count,
-                "url": f"https://reddit.com{sub.url}"
-            })
-        
-        return result
+        return _text(_fetch_trending())
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_front_page(sort: str = "hot", limit: int = 25) -> List[Dict[str, Any]]:
+def get_front_page(sort: str = "hot", limit: int = 25) -> TextContent:
     """
     Get posts from authenticated user's front page
     
@@ -1405,73 +1684,56 @@ def get_front_page(sort: str = "hot", limit: int = 25) -> List[Dict[str, Any]]:
     Returns:
         List of front page posts
     """
-    reddit = init_reddit()
     try:
-        if sort == "hot":
-            posts = reddit.front.hot(limit=limit)
-        elif sort == "new":
-            posts = reddit.front.new(limit=limit)
-        elif sort == "top":
-            posts = reddit.front.top(limit=limit)
-        elif sort == "rising":
-            posts = reddit.front.rising(limit=limit)
-        elif sort == "controversial":
-            posts = reddit.front.controversial(limit=limit)
-        else:
-            return [{"error": "Invalid sort method"}]
+        try:
+            timed = _SUBREDDIT_SORTS[sort]
+        except KeyError:
+            return _text([{"error": "Invalid sort method"}])
         
-        result = []
-        for post in posts:
-            result.append({
-                "id": post.id,
-                "title": post.title,
-                "author": str(post.author) if post.author else "[deleted]",
-                "subreddit": str(post.subreddit),
-                "created_utc": post.created_utc,
-                "score": post.score,
-                "upvote_ratio": post.upvote_ratio,
-                "num_comments": post.num_comments,
-                "url": post.url,
-                "selftext": post.selftext[:200] if post.selftext else None,
-                "permalink": f"https://reddit.com{post.permalink}",
-                "nsfw": post.over_18,
-                "spoiler": post.spoiler
-            })
+        # Match PRAW's front.top()/controversial() default of all time
+        posts = _listing(f"/{sort}", {"t": "all"} if timed else None, limit)
         
-        return result
+        return _text([
+            {
+                **_feed_post(post),
+                "upvote_ratio": post.get("upvote_ratio"),
+                "nsfw": post.get("over_18"),
+                "spoiler": post.get("spoiler")
+            }
+            for post in (child["data"] for child in posts)
+        ])
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_my_multireddits() -> List[Dict[str, Any]]:
+def get_my_multireddits() -> TextContent:
     """
     Get authenticated user's multireddits (custom feeds)
     
     Returns:
         List of multireddits
     """
-    reddit = init_reddit()
     try:
-        multireddits = reddit.user.me().multireddits()
-        result = []
-        
-        for multi in multireddits:
-            result.append({
-                "name": multi.name,
-                "display_name": multi.display_name,
-                "description": multi.description_md,
-                "subreddits": [str(sub) for sub in multi.subreddits],
-                "visibility": multi.visibility,
-                "path": multi.path,
-                "created_utc": multi.created_utc
-            })
+        # Each multi embeds its subreddit names, so one request covers them all
+        multireddits = _get("/api/multi/mine")
         
-        return result
+        return _text([
+            {
+                "name": multi.get("name"),
+                "display_name": multi.get("display_name"),
+                "description": multi.get("description_md"),
+                "subreddits": [sub["name"] for sub in multi["subreddits"]],
+                "visibility": multi.get("visibility"),
+                "path": multi.get("path"),
+                "created_utc": multi.get("created_utc")
+            }
+            for multi in (item["data"] for item in multireddits)
+        ])
     except Exception as e:
-        return [{"error": str(e)}]
+        return _text([{"error": str(e)}])
 
 @mcp.tool()
-def get_random_post(subreddit_name: Optional[str] = None) -> Dict[str, Any]:
+def get_random_post(subreddit_name: Optional[str] = None) -> TextContent:
     """
     Get a random post from Reddit or a specific subreddit
     
@@ -1481,17 +1743,17 @@ def get_random_post(subreddit_name: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Random post details
     """
-    reddit = init_reddit()
+    reddit = _REDDIT
     try:
         if subreddit_name:
-            submission = reddit.subreddit(subreddit_name).random()
+            submission = _subreddit(subreddit_name).random()
         else:
             submission = reddit.random_subreddit().random()
         
         if submission is None:
-            return {"error": "No random post available"}
+            return _text({"error": "No random post available"})
         
-        return {
+        return _text({
             "id": submission.id,
             "title": submission.title,
             "author": str(submission.author) if submission.author else "[deleted]",
@@ -1501,12 +1763,12 @@ def get_random_post(subreddit_name: Optional[str] = None) -> Dict[str, Any]:
             "num_comments": submission.num_comments,
             "url": submission.url,
             "selftext": submission.selftext,
-            "permalink": f"https://reddit.com{submission.permalink}",
+            "permalink": _REDDIT_BASE + submission.permalink,
             "nsfw": submission.over_18,
             "spoiler": submission.spoiler
-        }
+        })
     except Exception as e:
-        return {"error": str(e)}
+        return _text({"error": str(e)})
 
 # ============================================================================
 # MAIN EXECUTION